@@ -1,5 +1,6 @@
 import re
 import logging
+import functools
 import pathlib
 import textwrap
 import itertools
@@ -8,6 +9,7 @@ import collections.abc
 
 import attr
 from csvw.metadata import Column
+from clldutils.misc import lazyproperty
 from pycldf.dataset import Wordlist
 import pyclts.models
 
@@ -24,11 +26,52 @@ MD_NAME = 'cldf-metadata.json'
 ID_PATTERN = re.compile(r'[A-Za-z0-9_\-]+$')
 
 
+@functools.lru_cache(maxsize=None)
+def _default_cldf():
+    """
+    The default metadata is only read from, so we parse it just once per process.
+    """
+    return Wordlist.from_metadata(pathlib.Path(__file__).parent / MD_NAME)
+
+
+def _asdict_value(v):
+    """
+    Convert a non-scalar field value the way `attr.asdict` does.
+    """
+    if attr.has(v.__class__):
+        return attr.asdict(v)
+    if isinstance(v, (list, tuple, set, frozenset)):
+        return [_asdict_value(i) for i in v]
+    if isinstance(v, dict):
+        return {_asdict_value(k): _asdict_value(vv) for k, vv in v.items()}
+    return v
+
+
+def _make_asdict(cls):
+    """
+    Create a fast replacement for `attr.asdict` for instances of `cls`.
+
+    Scalar field values - the common case for our model classes - are copied as is; all other
+    values are converted like `attr.asdict` would, i.e. collections are copied and attrs
+    instances are converted to `dict`s.
+    """
+    names = tuple(f.name for f in attr.fields(cls))
+
+    def asdict(obj):
+        res = {}
+        for name in names:
+            v = getattr(obj, name)
+            res[name] = v if v is None or isinstance(v, (str, int, float)) else _asdict_value(v)
+        return res
+    return asdict
+
+
 class LexibankWriter(CLDFWriter):
     def __init__(self, **kw):
         super().__init__(**kw)
         self._count = collections.defaultdict(int)
         self._cognate_count = collections.defaultdict(int)
+        self._asdict = {}
 
     def write(self, **kw):
         from pylexibank import ENTRY_POINT
@@ -49,47 +92,60 @@ class LexibankWriter(CLDFWriter):
 
     def __enter__(self):
         super().__enter__()
-        default_cldf = Wordlist.from_metadata(pathlib.Path(__file__).parent / MD_NAME)
+        default_cldf = _default_cldf()
 
         self._obj_index = {}
-        for cls in [
+        classes = [
             self.dataset.lexeme_class,
             self.dataset.language_class,
             self.dataset.concept_class,
             self.dataset.cognate_class,
-        ]:
+        ]
+        # Table names and fieldnames are looked up per object, so we cache them:
+        self._table_of = {cls: cls.__cldf_table__() for cls in classes}
+        self._fields_of = {cls: cls.fieldnames() for cls in classes}
+        for cls in classes:
+            table = self._table_of[cls]
             if cls.__doc__:
-                self.cldf[cls.__cldf_table__()].common_props['dc:description'] = \
+                self.cldf[table].common_props['dc:description'] = \
                     textwrap.dedent(cls.__doc__)
 
-            self.objects[cls.__cldf_table__()] = []
-            self._obj_index[cls.__cldf_table__()] = set()
+            self.objects[table] = []
+            if table != 'FormTable':
+                # Form IDs are always created by `lexeme_id` and thus unique by construction, so
+                # we only need to keep track of IDs for the other tables.
+                self._obj_index[table] = set()
 
             cols = set(
-                col.header for col in self.cldf[cls.__cldf_table__()].tableSchema.columns)
+                col.header for col in self.cldf[table].tableSchema.columns)
             properties = set(
-                col.propertyUrl.uri for col in self.cldf[cls.__cldf_table__()].tableSchema.columns
+                col.propertyUrl.uri for col in self.cldf[table].tableSchema.columns
                 if col.propertyUrl)
-            for field in cls.fieldnames():
+            for field in self._fields_of[cls]:
                 try:
-                    col = default_cldf[cls.__cldf_table__(), field]
+                    col, cached = default_cldf[table, field], True
                     #
                     # We added Latitude and Longitude to the default metadata later, and want to
                     # make sure, existing datasets are upgraded silently.
                     #
                     if field in ['Latitude', 'Longitude'] \
-                            and cls.__cldf_table__() == 'LanguageTable':  # pragma: no cover
+                            and table == 'LanguageTable':  # pragma: no cover
                         properties.add(col.propertyUrl.uri)
-                        self.cldf[cls.__cldf_table__(), field].propertyUrl = col.propertyUrl
-                        self.cldf[cls.__cldf_table__(), field].datatype = col.datatype
+                        # Don't share (mutable) objects with the cached default metadata:
+                        copy = Column.fromvalue(col.asdict())
+                        self.cldf[table, field].propertyUrl = copy.propertyUrl
+                        self.cldf[table, field].datatype = copy.datatype
                 except KeyError:
                     kw = {k: v for k, v in attr.fields_dict(cls)[field].metadata.items()}
                     kw.setdefault('datatype', 'string')
                     kw.setdefault('name', field)
-                    col = Column.fromvalue(kw)
+                    col, cached = Column.fromvalue(kw), False
                 if (col.propertyUrl and col.propertyUrl.uri not in properties) or \
                         ((not col.propertyUrl) and (field not in cols)):
-                    self.cldf[cls.__cldf_table__()].tableSchema.columns.append(col)
+                    if cached:
+                        # Don't share (mutable) objects with the cached default metadata:
+                        col = Column.fromvalue(col.asdict())
+                    self.cldf[table].tableSchema.columns.append(col)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -102,9 +158,14 @@ class LexibankWriter(CLDFWriter):
                 del self.objects['CognateTable']
 
         # We only add concepts and languages that are referenced by forms!
-        for fk, table in [('Parameter_ID', 'ParameterTable'), ('Language_ID', 'LanguageTable')]:
-            refs = set(obj[fk] for obj in self.objects['FormTable'])
-            self.objects[table] = [obj for obj in self.objects[table] if obj['ID'] in refs]
+        pids, lids = set(), set()
+        for obj in self.objects['FormTable']:
+            pids.add(obj['Parameter_ID'])
+            lids.add(obj['Language_ID'])
+        for refs, table in [(pids, 'ParameterTable'), (lids, 'LanguageTable')]:
+            # Typically, all objects are referenced, so we avoid rebuilding the list in this case.
+            if not all(obj['ID'] in refs for obj in self.objects[table]):
+                self.objects[table] = [obj for obj in self.objects[table] if obj['ID'] in refs]
         super().__exit__(exc_type, exc_val, exc_tb)
 
     def add_sources(self, *args):
@@ -113,11 +174,12 @@ class LexibankWriter(CLDFWriter):
         self.cldf.sources.add(*args)
 
     def lexeme_id(self, kw):
-        self._count[(kw['Language_ID'], kw['Parameter_ID'])] += 1
-        return '{0}-{1}-{2}'.format(
-            kw['Language_ID'],
-            kw['Parameter_ID'],
-            self._count[(kw['Language_ID'], kw['Parameter_ID'])])
+        # We count per formatted prefix rather than per (Language_ID, Parameter_ID) pair, to make
+        # sure IDs are unique, e.g. for language "a-b" and parameter "c" vs. language "a" and
+        # parameter "b-c".
+        prefix = '{0}-{1}'.format(kw['Language_ID'], kw['Parameter_ID'])
+        self._count[prefix] += 1
+        return '{0}-{1}'.format(prefix, self._count[prefix])
 
     def cognate_id(self, kw):
         self._cognate_count[kw['Form_ID']] += 1
@@ -127,6 +189,10 @@ class LexibankWriter(CLDFWriter):
         if self.dataset.tokenizer:
             return self.dataset.tokenizer(item, string, **kw)
 
+    @lazyproperty
+    def _segment_replacements(self):
+        return [(k.split(), v.split()) for k, v in self.dataset.segments.items()]
+
     def add_form_with_segments(self, **kw):
         """
         :return: dict with the newly created lexeme
@@ -134,16 +200,17 @@ class LexibankWriter(CLDFWriter):
         # Do we have morpheme segmentation on top of phonemes?
         with_morphemes = '+' in self['FormTable', 'Segments'].separator
 
-        language, concept, value, form, segments = (kw.get(v) for v in [
-            'Language_ID', 'Parameter_ID', 'Value', 'Form', 'Segments'])
+        get = kw.get
+        language, concept, value, form, segments = (
+            get('Language_ID'), get('Parameter_ID'), get('Value'), get('Form'), get('Segments'))
 
         # check for required kws
         if not all([language, concept, value, form, segments]):
             raise ValueError('language, concept, value, form, and segments must be supplied')
 
         # Correct segments according to mapping in etc/segments.csv:
-        for k, v in self.dataset.segments.items():
-            segments = list(iter_repl(segments, k.split(), v.split()))
+        for k, v in self._segment_replacements:
+            segments = list(iter_repl(segments, k, v))
         kw['Segments'] = segments
         kw.update(ID=self.lexeme_id(kw), Form=form)
         lexeme = self._add_object(self.dataset.lexeme_class, **kw)
@@ -156,11 +223,9 @@ class LexibankWriter(CLDFWriter):
             valid = valid_sequence(segments)
             _, _bipa, _sc, _analysis = analyze(self.args.clts.api, segments, analysis)
 
-            # update the list of `bad_words` if necessary; we precompute a
-            # list of data types in `_bipa` just to make the conditional
-            # checking easier
-            _bipa_types = [type(s) for s in _bipa]
-            if (pyclts.models.UnknownSound in _bipa_types) or '?' in _sc or not valid:
+            # update the list of `bad_words` if necessary
+            if (not valid) or '?' in _sc or \
+                    any(type(s) is pyclts.models.UnknownSound for s in _bipa):
                 self.dataset.tr_bad_words.append(kw)
         except ValueError:  # pragma: no cover
             self.dataset.tr_invalid_words.append(kw)
@@ -173,8 +238,9 @@ class LexibankWriter(CLDFWriter):
         """
         :return: dict with the newly created form
         """
-        language, concept, value, form = [kw.get(v) for v in [
-            'Language_ID', 'Parameter_ID', 'Value', 'Form']]
+        get = kw.get
+        language, concept, value, form = (
+            get('Language_ID'), get('Parameter_ID'), get('Value'), get('Form'))
 
         # check for required kws
         if language is None or concept is None or value is None \
@@ -187,7 +253,7 @@ class LexibankWriter(CLDFWriter):
 
         # point to difference in value and form
         if form != value:
-            log.debug('iter_forms split: "{0}" -> "{1}"'.format(value, form))
+            log.debug('iter_forms split: "%s" -> "%s"', value, form)
 
         if form and form not in self.dataset.form_spec.missing_data:
             # try to segment the data now
@@ -220,13 +286,13 @@ class LexibankWriter(CLDFWriter):
         # Do we have morpheme segmentation on top of phonemes?
         with_morphemes = '+' in self['FormTable', 'Segments'].separator
 
-        for i, form in enumerate(split_value(kw, kw['Value'], **svkw)):
-            kw_ = kw.copy()
-            kw_['Form'] = form
-            if kw_['Form']:
-                kw_ = self.add_form(with_morphemes=with_morphemes, **kw_)
-                if kw_:
-                    lexemes.append(kw_)
+        for form in split_value(kw, kw['Value'], **svkw):
+            if form:
+                # Note: Passing `kw` as keyword arguments creates a new `dict` in `add_form`
+                # anyway, so there's no need to copy `kw` here.
+                lexeme = self.add_form(with_morphemes=with_morphemes, Form=form, **kw)
+                if lexeme:
+                    lexemes.append(lexeme)
 
         return lexemes
 
@@ -237,22 +303,28 @@ class LexibankWriter(CLDFWriter):
         return self.add_forms_from_value(split_value=split_value, **kw)
 
     def _add_object(self, cls, **kw):
+        asdict = self._asdict.get(cls)
+        if asdict is None:
+            asdict = self._asdict[cls] = _make_asdict(cls)
         # Instantiating an object will trigger potential validators:
-        d = attr.asdict(cls(**kw))
+        d = asdict(cls(**kw))
         #
         # FIXME: check whether certain attributes should not be written to the table.
         #
-        t = cls.__cldf_table__()
+        t = self._table_of.get(cls) or cls.__cldf_table__()
+        match = ID_PATTERN.match
         for key in ['ID', 'Language_ID', 'Parameter_ID', 'Cognateset_ID']:
             # stringify/sluggify identifiers:
             if d.get(key) is not None:
                 d[key] = '{0}'.format(d[key])
-                if not ID_PATTERN.match(d[key]):
+                if not match(d[key]):
                     raise ValueError(
                         'invalid CLDF identifier {0}-{1}: {2}'.format(t, key, d[key]))
-        if 'ID' not in d or d['ID'] not in self._obj_index[t]:
-            if 'ID' in d:
-                self._obj_index[t].add(d['ID'])
+        index = self._obj_index.get(t)
+        if index is None or 'ID' not in d:
+            self.objects[t].append(d)
+        elif d['ID'] not in index:
+            index.add(d['ID'])
             self.objects[t].append(d)
         return d
 
@@ -308,9 +380,12 @@ class LexibankWriter(CLDFWriter):
         """
         assert callable(id_factory) or isinstance(id_factory, str)
         ids = collections.OrderedDict()
+        glottocode_by_iso = None
         for i, kw in enumerate(self.dataset.languages):
             if (not kw.get('Glottocode')) and kw.get('ISO639P3code'):
-                kw['Glottocode'] = self.dataset.glottolog.glottocode_by_iso.get(kw['ISO639P3code'])
+                if glottocode_by_iso is None:
+                    glottocode_by_iso = self.dataset.glottolog.glottocode_by_iso
+                kw['Glottocode'] = glottocode_by_iso.get(kw['ISO639P3code'])
             kw['ID'] = id_factory(kw) if callable(id_factory) else kw[id_factory]
             if lookup_factory is None:
                 key = i
@@ -320,9 +395,14 @@ class LexibankWriter(CLDFWriter):
             self.add_language(**kw)
         return ids if lookup_factory else list(ids.values())
 
+    @lazyproperty
+    def _concepticon_glosses(self):
+        # Resolved once per writer, since `add_concept` is typically called for many concepts.
+        return self.dataset.concepticon.cached_glosses
+
     def add_concept(self, **kw):
         if kw.get('Concepticon_ID'):
-            gloss = self.dataset.concepticon.cached_glosses[int(kw['Concepticon_ID'])]
+            gloss = self._concepticon_glosses[int(kw['Concepticon_ID'])]
             if kw.get('Concepticon_Gloss') and kw.get('Concepticon_Gloss') != gloss:
                 raise ValueError('Concepticon ID / Gloss mismatch %s != %s' % (
                     kw.get('Concepticon_Gloss'), gloss
@@ -330,13 +410,14 @@ class LexibankWriter(CLDFWriter):
             kw['Concepticon_Gloss'] = gloss
         return self._add_object(self.dataset.concept_class, **kw)
 
-    def add_concepts(self, id_factory=lambda d: d.number, lookup_factory=None):
+    def add_concepts(self, id_factory='number', lookup_factory=None):
         """
         Add concepts as specified in a dataset's associated Concepticon concept list or in
         etc/concepts.csv
 
         :param id_factory: A callable taking a pyconcepticon.api.Concept object as argument and \
-        returning a value to be used as ID for the concept.
+        returning a value to be used as ID for the concept or a `str` specifying an attribute in \
+        `Concept`.
         :param lookup_factory: A callable taking a `dict` object and returning a reverse \
         lookup key to associate the generated ID with (or a `str` specifying an attribute in \
         `Concept`).
@@ -344,12 +425,13 @@ class LexibankWriter(CLDFWriter):
         passed, otherwise an `OrderedDict`, mapping lookup to ID.
         """
         assert callable(id_factory) or isinstance(id_factory, str)
+        fieldnames = self._fields_of[self.dataset.concept_class]
 
         ids, attrss = get_ids_and_attrs(
             # Read pyconcepticon.Concept instances either from a conceptlist in Concepticon, or from
             # etc/concepts.csv:
             get_concepts(self.dataset.conceptlists, self.dataset.concepts),
-            {f.lower(): f for f in self.dataset.concept_class.fieldnames()},
+            {f.lower(): f for f in fieldnames},
             id_factory,
             lookup_factory,
         )
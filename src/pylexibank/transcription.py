@@ -80,23 +80,16 @@ def analyze(clts, segments, analysis, lookup=dict(bipa={}, dolgo={})):
         print(segments)
         raise
 
-    # compute general errors; this loop must take place outside the
-    # following one because the code for computing single errors (either
-    # in `bipa_analysis` or in `soundclass_analysis`) is unnecessary
-    # complicated
-    for sound_bipa, sound_class in zip(bipa_analysis, sc_analysis):
-        if isinstance(sound_bipa, pyclts.models.UnknownSound) or sound_class == '?':
-            analysis.general_errors += 1
-
     # iterate over the segments and analyses, updating counts of occurrences
     # and specific errors
     for segment, sound_bipa, sound_class in zip(segments, bipa_analysis, sc_analysis):
         # update the segment count
-        analysis.segments.update([segment])
+        analysis.segments[segment] += 1
 
         # add an error if we got an unknown sound, otherwise just append
         # the `replacements` dictionary
-        if isinstance(sound_bipa, pyclts.models.UnknownSound):
+        unknown = isinstance(sound_bipa, pyclts.models.UnknownSound)
+        if unknown:
             analysis.bipa_errors.add(segment)
         else:
             analysis.replacements[sound_bipa.source].add(str(sound_bipa))
@@ -105,6 +98,10 @@ def analyze(clts, segments, analysis, lookup=dict(bipa={}, dolgo={})):
         if sound_class == '?':
             analysis.sclass_errors.add(segment)
 
+        # update the count of general errors
+        if unknown or sound_class == '?':
+            analysis.general_errors += 1
+
     return segments, bipa_analysis, sc_analysis, analysis
 
 
@@ -1,4 +1,5 @@
 import re
+import json
 import pathlib
 import itertools
 import collections
@@ -20,6 +21,8 @@ YEAR_PATTERN = re.compile(r'\s+\(?(?P<year>[1-9][0-9]{3}(-[0-9]+)?)(\)|\.)')
 def progressbar(iterable=None, **kw):
     kw.setdefault('leave', False)
     kw.setdefault('desc', 'cldfbench')
+    # Refresh the display less often than tqdm's default of every 0.1 seconds:
+    kw.setdefault('mininterval', 0.5)
     return tqdm(iterable=iterable, **kw)
 
 
@@ -32,15 +35,16 @@ def iter_repl(seq, subseq, repl):
     Replace sub-list `subseq` in `seq` with `repl`.
     """
     seq, subseq, repl = list(seq), list(subseq), list(repl)
-    subseq_len = len(subseq)
-    rem = seq[:]
-    while rem:
-        if rem[:subseq_len] == subseq:
+    subseq_len, seq_len = len(subseq), len(seq)
+    i = 0
+    while i < seq_len:
+        if seq[i:i + subseq_len] == subseq:
             for c in repl:
                 yield c
-            rem = rem[subseq_len:]
+            i += subseq_len
         else:
-            yield rem.pop(0)
+            yield seq[i]
+            i += 1
 
 
 def split_by_year(s):
@@ -87,14 +91,28 @@ def get_badge(ratio, name):
 
 
 def sorted_obj(obj):
-    res = obj
-    if isinstance(obj, dict):
-        res = collections.OrderedDict()
-        obj.pop(None, None)
-        for k, v in sorted(obj.items()):
-            res[k] = sorted_obj(v)
-    elif isinstance(obj, (list, set)):
-        res = [sorted_obj(v) for v in obj]
+    """
+    Return a copy of `obj` with all (nested) `dict`s sorted by key.
+
+    Note: Nested containers are processed using a worklist rather than recursion.
+    """
+    def copy(o):
+        if isinstance(o, dict):
+            o.pop(None, None)
+            return dict(sorted(o.items()))
+        return list(o)
+
+    if not isinstance(obj, (dict, list, set)):
+        return obj
+    res = copy(obj)
+    stack = [res]
+    while stack:
+        container = stack.pop()
+        for k in (container.keys() if isinstance(container, dict) else range(len(container))):
+            v = container[k]
+            if isinstance(v, (dict, list, set)):
+                container[k] = v = copy(v)
+                stack.append(v)
     return res
 
 
@@ -109,7 +127,9 @@ def jsondump(obj, fname, log=None):
         d = jsonlib.load(fname)
         d.update(obj)
         obj = d
-    jsonlib.dump(sorted_obj(obj), fname, indent=4)
+    # Serializing to a string first lets us write the file in one go, rather than in many small
+    # chunks as `json.dump` does:
+    fname.write_text(json.dumps(sorted_obj(obj), indent=4), encoding='utf-8')
     log_dump(fname, log=log)
     return obj
 
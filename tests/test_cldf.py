@@ -1,11 +1,14 @@
 from argparse import Namespace
+from pathlib import Path
 
 import pytest
 import attr
 
-from pylexibank.cldf import LexibankWriter
+import pylexibank.cldf
+from pylexibank.cldf import LexibankWriter, MD_NAME, _make_asdict, _default_cldf
 from pylexibank import Language, Dataset
-from clldutils.jsonlib import load
+from clldutils.jsonlib import load, dump
+from cldfbench.cldf import CLDFSpec
 
 
 def test_align_cognates(dataset, clts, mocker):
@@ -96,3 +99,74 @@ def test_custom_columns(tmp_path, clts, mocker):
     md = tmp_path.joinpath('cldf', 'cldf-metadata.json').read_text(encoding='utf8')
     assert '-+-+-' in md
     assert 'abcdefg' in md
+
+
+def test_add_object_copies_collections(dataset, clts, mocker):
+    with LexibankWriter(
+        cldf_spec=dataset.cldf_specs(),
+        dataset=dataset,
+        args=Namespace(clts=mocker.Mock(api=clts))
+    ) as ds:
+        source = ['src']
+        lex = ds.add_form_with_segments(
+            Language_ID='l', Parameter_ID='p', Value='x', Form='x', Segments=['x'], Source=source)
+        assert lex['Source'] == source and lex['Source'] is not source
+
+
+def test_make_asdict():
+    @attr.s
+    class Inner:
+        x = attr.ib(default=1)
+
+    @attr.s
+    class Obj:
+        a = attr.ib(default='a')
+        b = attr.ib(default=attr.Factory(dict))
+        c = attr.ib(default=frozenset([1]))
+        d = attr.ib(default=attr.Factory(Inner))
+        e = attr.ib(default=attr.Factory(lambda: [Inner(), {'k': [1]}]))
+
+    obj = Obj(b={'k': [1]})
+    d = _make_asdict(Obj)(obj)
+    assert d == attr.asdict(obj)
+    assert d['b'] is not obj.b and d['b']['k'] is not obj.b['k']
+    assert d['c'] == [1] and d['d'] == {'x': 1}
+
+
+def test_lexeme_id_unique(dataset, clts, mocker):
+    with LexibankWriter(
+        cldf_spec=dataset.cldf_specs(),
+        dataset=dataset,
+        args=Namespace(clts=mocker.Mock(api=clts))
+    ) as ds:
+        for lid, pid in [('a-b', 'c'), ('a', 'b-c'), (1, 'c'), ('1', 'c')]:
+            ds.add_form_with_segments(
+                Language_ID=lid, Parameter_ID=pid, Value='x', Form='x', Segments=['x'])
+        ids = [f['ID'] for f in ds.objects['FormTable']]
+        assert len(ids) == 4 and len(set(ids)) == 4
+
+
+def test_default_metadata_not_shared(dataset, clts, mocker, tmp_path):
+    # A metadata file lacking a column, which thus must be added from the default metadata:
+    md = load(Path(pylexibank.cldf.__file__).parent / MD_NAME)
+    for t in md['tables']:
+        if t['url'] == 'forms.csv':
+            t['tableSchema']['columns'] = [
+                c for c in t['tableSchema']['columns'] if c['name'] != 'Segments']
+    dump(md, tmp_path / 'md.json')
+
+    def writer():
+        return LexibankWriter(
+            cldf_spec=CLDFSpec(
+                module='Wordlist',
+                dir=tmp_path / 'cldf',
+                metadata_fname=MD_NAME,
+                default_metadata_path=tmp_path / 'md.json'),
+            dataset=dataset,
+            args=Namespace(clts=mocker.Mock(api=clts)))
+
+    with writer() as ds:
+        assert ds.cldf['FormTable', 'Segments'] is not _default_cldf()['FormTable', 'Segments']
+        ds.cldf['FormTable', 'Segments'].separator = '+'
+    with writer() as ds:
+        assert ds.cldf['FormTable', 'Segments'].separator == ' '
@@ -76,6 +76,9 @@ def test_sorted_obj():
     assert util.sorted_obj(d1) == util.sorted_obj(d2)
     assert util.sorted_obj(d2)['b']['a'] == 3
     util.sorted_obj(['http://www.w3.org/ns/csvw', {'@language': 'en'}])
+    res = util.sorted_obj({'b': [{'y': 1, 'x': {2}}], None: 1, 'a': 0})
+    assert list(res) == ['a', 'b']
+    assert list(res['b'][0]) == ['x', 'y'] and res['b'][0]['x'] == [2]
 
 
 def test_get_concepts(concepticon):